@@ -2,23 +2,33 @@
 
 from dash import Dash
 import dash_bootstrap_components as dbc
+from flask import Flask
+import plotly.io as pio
 
+from dashboard.cache import cache
+from dashboard.components.charts import register_callbacks
 from dashboard.components.layout import create_layout
-from dashboard.data import Data
 
 
-db_data = Data()
+# Serialize figures with orjson, which is much faster than the default
+# json encoder for the large arrays in the line charts.
+pio.json.config.default_engine = "orjson"
 
 
 def main() -> None:
 
+    server = Flask(__name__)
+    cache.init_app(server)
+
     app = Dash(
         __name__,
+        server=server,
         use_pages=True,
         external_stylesheets=[dbc.themes.BOOTSTRAP],
         suppress_callback_exceptions=True,
     )
     app.layout = create_layout()
+    register_callbacks(app)
     app.run_server(debug=True)
 
 
@@ -0,0 +1,8 @@
+/* Clientside callbacks which update charts from data stored in the page. */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    charts: {
+        // Select the answers over time figure for the chosen time period.
+        answersOverTime: (period, figures) => figures[period],
+    },
+});
@@ -0,0 +1,21 @@
+/* Clientside callbacks which update chart titles from selector values. */
+
+function splitTitle(title) {
+    // Introduce whitespace to concatenated words, e.g. 'WordGroup' is
+    // converted to 'Word Group'. 'ID' is matched as a single word so
+    // that 'WordID' is converted to 'Word ID'.
+    return (title.match(/ID|[A-Z][a-z]*/g) || []).join(" ");
+}
+
+function countTitle(id, category) {
+    return `${splitTitle(id)} Count per ${category}`;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    titles: {
+        answersOverTime: (period) => `Answers Count per ${period}`,
+        wordCategory: (id) => countTitle(id, "Word Category"),
+        grammarCategory: (id) => countTitle(id, "Grammar Category"),
+        partOfSpeech: (id) => countTitle(id, "Part of Speech"),
+    },
+});
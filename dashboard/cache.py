@@ -0,0 +1,18 @@
+"""Module with the server-side cache shared by the dashboard.
+
+The cache is created without an app and is bound to the dashboard's
+Flask server in dashboard/app.py. A file system cache is used rather
+than functools.lru_cache so that cached results are shared between
+the processes serving the dashboard.
+"""
+
+from flask_caching import Cache
+
+
+cache = Cache(
+    config={
+        "CACHE_TYPE": "FileSystemCache",
+        "CACHE_DIR": ".cache",
+        "CACHE_DEFAULT_TIMEOUT": 600,
+    }
+)
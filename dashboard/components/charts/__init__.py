@@ -1,4 +1,11 @@
-from .answers import plot_answers_summary, plot_answers_over_time
+from dash import Dash
+
+from . import answers, database
+from .answers import (
+    plot_answers_summary,
+    plot_answers_over_time,
+    plot_answers_over_time_figures,
+)
 from .database import plot_database_summary
 from .performance import plot_cumulative_average, plot_marks_summary
 from .indicators import plot_gauge
@@ -12,6 +19,7 @@ from .layout import (
 __all__ = [
     "plot_answers_summary",
     "plot_answers_over_time",
+    "plot_answers_over_time_figures",
     "plot_database_summary",
     "plot_cumulative_average",
     "plot_marks_summary",
@@ -19,4 +27,15 @@ __all__ = [
     "ChartLayout",
     "PerformanceColours",
     "SummaryColours",
+    "register_callbacks",
 ]
+
+
+def register_callbacks(app: Dash) -> None:
+    """Register the callbacks for all charts updated by page inputs.
+
+    Args:
+        app: The Dash app to register the callbacks with.
+    """
+    answers.register_callbacks(app)
+    database.register_callbacks(app)
@@ -1,32 +1,71 @@
 """Module with functions to plot charts on the answers summary page."""
 
-from dash import dcc, html, Input, Output, callback
+import json
+import math
+
+from dash import ClientsideFunction, Dash, dcc, html, Input, Output, State
 import plotly.graph_objects as go
-import numpy as np
+import plotly.io as pio
+import polars as pl
 
-from dashboard.app import db_data
+from dashboard.cache import cache
 from dashboard.components import AnswerIds
 from dashboard.components.charts import horizontal_bar
 from dashboard.components.charts.layout import ChartLayout, SummaryColours
-from dashboard.utilities import format_enums
+from dashboard.data import get_db_data
+from dashboard.utilities import format_enum_series
 
 
-def plot_answers_summary(category: str) -> html.Div:
-    """Plot a horizontal bar chart showing answers
+# Layout for the answers over time line chart. Plotly does not mutate the
+# layout dict so it is merged once rather than on every callback.
+_ANSWERS_OVER_TIME_LAYOUT = {
+    **ChartLayout.LINE_MERGED,
+    "margin": {"t": 30},
+    "height": 600,
+}
+
+# Time periods which the answers over time chart can be displayed by.
+_TIME_PERIODS = ("Day", "Week", "Month")
+
+
+def _downsample(df: pl.DataFrame, max_points: int = 2000) -> pl.DataFrame:
+    """Take every nth row so the DataFrame has at most max_points rows.
+
+    Charts with a point for every day can have thousands of points, all
+    of which would otherwise be serialized and rendered in the browser.
 
     Args:
-        category: Category to be used for the y-axis.
+        df: DataFrame to downsample.
+        max_points: Maximum number of rows to keep. Defaults to 2000.
 
     Returns:
-        html.Div containing a Dash Core Components Graph object with
-        the plotted chart.
+        DataFrame with at most max_points rows.
     """
-    df = db_data.count_answers_by_category(category)
+    if df.height <= max_points:
+        return df
+    return df.take_every(math.ceil(df.height / max_points))
+
+
+@cache.memoize()
+def _answers_summary_json(category: str, version: str) -> str:
+    """Return the answers summary chart serialized as JSON.
 
-    categories = [format_enums(cat) for cat in df.get_column(category)]
-    customdata = np.stack(
-        (df.get_column("Answer Count"), df.get_column("Word Count")),
-        axis=-1,
+    Args:
+        category: Category to be used for the y-axis.
+        version: Version of the fetched data. It is part of the cache
+            key, so the chart is rebuilt when the data changes.
+
+    Returns:
+        JSON string of the plotted chart.
+    """
+    df = get_db_data().count_answers_by_category(category)
+
+    categories = format_enum_series(df.get_column(category))
+    customdata = list(
+        zip(
+            df.get_column("Answer Count").to_list(),
+            df.get_column("Word Count").to_list(),
+        )
     )
     hovertemplate = (
         "Total Words: %{customdata[0]}"
@@ -35,39 +74,44 @@ def plot_answers_summary(category: str) -> html.Div:
     )
 
     fig = horizontal_bar.plot(
-        x=df.get_column("Ratio").to_list(),
+        x=df.get_column("Ratio").to_numpy(),
         y=categories,
         customdata=customdata,
         hovertemplate=hovertemplate,
     )
 
+    return pio.to_json(fig)
+
+
+def plot_answers_summary(category: str) -> html.Div:
+    """Plot a horizontal bar chart showing answers
+
+    Args:
+        category: Category to be used for the y-axis.
+
+    Returns:
+        html.Div containing a Dash Core Components Graph object with
+        the plotted chart.
+    """
     return html.Div(
-        dcc.Graph(figure=fig),
+        dcc.Graph(
+            figure=json.loads(_answers_summary_json(category, get_db_data().version))
+        ),
         id=f"answers-summary-{category}",
     )
 
 
-@callback(
-    Output(AnswerIds.ANSWERS_OVER_TIME, "children"),
-    Input(AnswerIds.TIME_PERIOD_INPUT, "value"),
-)
-def plot_answers_over_time(period: str) -> dcc.Graph:
-    """Plot a line chart number of answers over time.
-
-    Time on the x-axis can be displayed by day, week number or month.
-    The chart contains a line displaying the number of answers for each
-    unit of the selected period as well as a rolling average. The
-    duration over which the rolling averages are calculated vary by
-    period:
-        Day: 30 days
-        Week: 4 weeks
-        Month: 3 months
+@cache.memoize()
+def _answers_over_time_json(period: str, version: str) -> str:
+    """Return the answers over time chart serialized as JSON.
 
     Args:
         period: Time period to use for the x-axis.
+        version: Version of the fetched data. It is part of the cache
+            key, so the chart is rebuilt when the data changes.
 
     Returns:
-        Dash Core Components Graph object with the plotted chart.
+        JSON string of the plotted chart.
     """
     rolling_periods = {
         "Day": 30,
@@ -76,23 +120,23 @@ def plot_answers_over_time(period: str) -> dcc.Graph:
     }
     rolling_period = rolling_periods[period]
 
-    df = db_data.count_answers_by_time_period(period, rolling_period)
+    df = get_db_data().count_answers_by_time_period(period, rolling_period)
+    df = _downsample(df)
 
     periods = df.get_column("Period")
     counts = df.get_column("Count")
     rolling_averages = df.get_column("Rolling Average")
-    customdata = np.stack(
-        (periods.cast(str), counts.cast(str), rolling_averages.round(2).cast(str)),
-        axis=-1,
+    customdata = list(
+        zip(periods.to_list(), counts.to_list(), rolling_averages.to_list())
     )
     hovertemplate = (
         "Period: %{customdata[0]}<br>"
         + "Answers: %{customdata[1]}<br>"
-        + "Rolling Average: %{customdata[2]}"
+        + "Rolling Average: %{customdata[2]:.2f}"
     )
 
     data = [
-        go.Scatter(
+        go.Scattergl(
             x=periods,
             y=counts,
             marker={"color": SummaryColours.LINE},
@@ -101,7 +145,7 @@ def plot_answers_over_time(period: str) -> dcc.Graph:
             customdata=customdata,
             hovertemplate=hovertemplate,
         ),
-        go.Scatter(
+        go.Scattergl(
             x=periods,
             y=rolling_averages,
             marker={"color": SummaryColours.AVERAGE_LINE},
@@ -113,13 +157,65 @@ def plot_answers_over_time(period: str) -> dcc.Graph:
         ),
     ]
 
-    layout = dict(
-        **ChartLayout.GENERAL,
-        **ChartLayout.LINE,
-        margin={"t": 30},
-        height=600,
-    )
+    fig = go.Figure(data=data, layout=_ANSWERS_OVER_TIME_LAYOUT)
+
+    return pio.to_json(fig)
+
+
+def plot_answers_over_time(period: str) -> dict:
+    """Plot a line chart number of answers over time.
+
+    Time on the x-axis can be displayed by day, week number or month.
+    The chart contains a line displaying the number of answers for each
+    unit of the selected period as well as a rolling average. The
+    duration over which the rolling averages are calculated vary by
+    period:
+        Day: 30 days
+        Week: 4 weeks
+        Month: 3 months
+
+    Args:
+        period: Time period to use for the x-axis.
+
+    Returns:
+        Figure dict for the chart's 'figure' property. The Graph itself
+        is rendered once in the page layout.
+    """
+    return json.loads(_answers_over_time_json(period, get_db_data().version))
+
+
+def plot_answers_over_time_figures() -> dict[str, dict]:
+    """Plot the answers over time line chart for every time period.
+
+    The figures are stored in the page so that switching the time
+    period is handled in the browser, without a request to the server.
+
+    Returns:
+        Figure dicts for the chart's 'figure' property, keyed by time
+        period.
+    """
+    return {period: plot_answers_over_time(period) for period in _TIME_PERIODS}
 
-    fig = go.Figure(data=data, layout=layout)
 
-    return dcc.Graph(figure=fig)
+def register_callbacks(app: Dash) -> None:
+    """Register the answers summary page chart and title callbacks.
+
+    Args:
+        app: The Dash app to register the callbacks with.
+    """
+    # The figures for every time period are stored in the page, so the
+    # chart is switched between them in the browser by assets/charts.js.
+    app.clientside_callback(
+        ClientsideFunction(namespace="charts", function_name="answersOverTime"),
+        Output(AnswerIds.ANSWERS_OVER_TIME, "figure"),
+        Input(AnswerIds.TIME_PERIOD_INPUT, "value"),
+        State(AnswerIds.ANSWERS_OVER_TIME_FIGURES, "data"),
+    )
+
+    # The chart title only interpolates the selected period, so it is
+    # updated in the browser by a function in assets/titles.js.
+    app.clientside_callback(
+        ClientsideFunction(namespace="titles", function_name="answersOverTime"),
+        Output(AnswerIds.ANSWERS_OVER_TIME_TITLE, "children"),
+        Input(AnswerIds.TIME_PERIOD_INPUT, "value"),
+    )
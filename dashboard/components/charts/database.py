@@ -1,35 +1,37 @@
 """Module with functions to plot charts on the database summary page."""
 
-from dash import dcc, Input, Output, callback
-import numpy as np
+import json
 
-from dashboard.app import db_data
+from dash import ClientsideFunction, Dash, Input, Output
+import plotly.io as pio
+
+from dashboard.cache import cache
 from dashboard.components import DatabaseIds
 from dashboard.components.charts import horizontal_bar
-from dashboard.utilities import format_enums
-
+from dashboard.data import get_db_data
+from dashboard.utilities import format_enum_series
 
-def plot_database_summary(group_by: str, count_by: str) -> dcc.Graph:
-    """Plot horizontal bar chart showing aggregated database contents.
 
-    Create a horizontal bar chart with category attributes on the y-axis
-    and word counts, aggregated by either WordID or WordCategory, on the
-    x-axis.
+@cache.memoize()
+def _database_summary_json(group_by: str, count_by: str, version: str) -> str:
+    """Return the database summary chart serialized as JSON.
 
     Args:
         group_by: Attribute to group by, either GrammarCategory,
             PartofSpeech or WordCategory
 
         count_by: Attribute to count by, either WordID or WordCategory.
+        version: Version of the fetched data. It is part of the cache
+            key, so the chart is rebuilt when the data changes.
 
     Returns:
-        Dash Core Components Graph object with the plotted chart.
+        JSON string of the plotted chart.
     """
-    df = db_data.count_words_by_category(group_by, count_by)
+    df = get_db_data().count_words_by_category(group_by, count_by)
 
-    categories = [format_enums(s) for s in df.get_column("Category").to_list()]
-    counts = df.get_column("Count").to_list()
-    customdata = np.stack((counts, categories), axis=-1)
+    categories = format_enum_series(df.get_column("Category"))
+    counts = df.get_column("Count").to_numpy()
+    customdata = list(zip(counts, categories))
     hovertemplate = "%{customdata[1]}<br>%{customdata[0]}<extra></extra>"
 
     fig = horizontal_bar.plot(
@@ -39,34 +41,33 @@ def plot_database_summary(group_by: str, count_by: str) -> dcc.Graph:
         hovertemplate=hovertemplate,
     )
 
-    return dcc.Graph(figure=fig)
+    return pio.to_json(fig)
 
 
-@callback(
-    Output(DatabaseIds.PART_OF_SPEECH_BAR_CHART, "children"),
-    Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
-)
-def plot_database_part_of_speech_summary(count_by: str) -> dcc.Graph:
-    """Plot bar chart showing database contents by part of speech.
+def plot_database_summary(group_by: str, count_by: str) -> dict:
+    """Plot horizontal bar chart showing aggregated database contents.
+
+    Create a horizontal bar chart with category attributes on the y-axis
+    and word counts, aggregated by either WordID or WordCategory, on the
+    x-axis.
 
     Args:
-        count_by: Select the attribute to aggregate categories by,
-            either WordID or WordCategory. This value is fetched by the
-            callback from the 'id-group-selector' radio selector
-            component.
+        group_by: Attribute to group by, either GrammarCategory,
+            PartofSpeech or WordCategory
+
+        count_by: Attribute to count by, either WordID or WordCategory.
 
     Returns:
-        Dash Core Components Graph object with the plotted chart.
+        Figure dict for the chart's 'figure' property.
     """
-    return plot_database_summary("PartOfSpeech", count_by)
+    return json.loads(_database_summary_json(group_by, count_by, get_db_data().version))
 
 
-@callback(
-    Output(DatabaseIds.WORD_CATEGORY_BAR_CHART, "children"),
-    Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
-)
-def plot_database_word_category_summary(count_by: str) -> dcc.Graph:
-    """Plot bar chart showing database contents by word category.
+def plot_database_summaries(count_by: str) -> tuple[dict, dict, dict]:
+    """Plot the part of speech, word category and grammar category charts.
+
+    The three charts share the same input so they are updated by a
+    single callback, rather than one callback and request per chart.
 
     Args:
         count_by: Select the attribute to aggregate categories by,
@@ -75,25 +76,43 @@ def plot_database_word_category_summary(count_by: str) -> dcc.Graph:
             component.
 
     Returns:
-        Dash Core Components Graph object with the plotted chart.
+        Figure dicts for the part of speech, word category and grammar
+        category charts.
     """
-    return plot_database_summary("WordCategory", count_by)
+    return (
+        plot_database_summary("PartOfSpeech", count_by),
+        plot_database_summary("WordCategory", count_by),
+        plot_database_summary("GrammarCategory", count_by),
+    )
 
 
-@callback(
-    Output(DatabaseIds.GRAMMAR_CATEGORY_BAR_CHART, "children"),
-    Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
-)
-def plot_database_grammar_category_summary(count_by: str) -> dcc.Graph:
-    """Plot bar chart showing database contents by grammar category.
+def register_callbacks(app: Dash) -> None:
+    """Register the database summary page chart and title callbacks.
 
     Args:
-        count_by: Select the attribute to aggregate categories by,
-            either WordID or WordCategory. This value is fetched by the
-            callback from the 'id-group-selector' radio selector
-            component.
-
-    Returns:
-        Dash Core Components Graph object with the plotted chart.
+        app: The Dash app to register the callbacks with.
     """
-    return plot_database_summary("GrammarCategory", count_by)
+    app.callback(
+        Output(DatabaseIds.PART_OF_SPEECH_BAR_CHART, "figure"),
+        Output(DatabaseIds.WORD_CATEGORY_BAR_CHART, "figure"),
+        Output(DatabaseIds.GRAMMAR_CATEGORY_BAR_CHART, "figure"),
+        Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
+    )(plot_database_summaries)
+
+    # The chart titles only interpolate the selected ID, so they are
+    # updated in the browser by functions in assets/titles.js.
+    app.clientside_callback(
+        ClientsideFunction(namespace="titles", function_name="wordCategory"),
+        Output(DatabaseIds.WORD_CATEGORY_BAR_CHART_TITLE, "children"),
+        Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
+    )
+    app.clientside_callback(
+        ClientsideFunction(namespace="titles", function_name="grammarCategory"),
+        Output(DatabaseIds.GRAMMAR_CATEGORY_BAR_CHART_TITLE, "children"),
+        Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
+    )
+    app.clientside_callback(
+        ClientsideFunction(namespace="titles", function_name="partOfSpeech"),
+        Output(DatabaseIds.PART_OF_SPEECH_BAR_CHART_TITLE, "children"),
+        Input(DatabaseIds.ID_GROUP_SELECTOR, "value"),
+    )
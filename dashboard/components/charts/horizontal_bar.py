@@ -8,10 +8,10 @@ from dashboard.components.charts.layout import ChartLayout, SummaryColours
 
 
 def plot(
-    x: list,
+    x: list | np.ndarray,
     y: list,
-    customdata: np.ndarray,
     hovertemplate: str,
+    customdata: list | np.ndarray | None = None,
     marker_colour: pl.Series | str = SummaryColours.BAR,
     height: int = 450,
 ) -> go.Figure:
@@ -20,8 +20,9 @@ def plot(
     Args:
         x: Array with x-axis coordinates.
         y: Array with y-axis coordinates.
-        customdata: NumPy NDArray with custom hoverlabel data.
         hovertemplate: Template for the custome hoverlabel.
+        customdata: Array with custom hoverlabel data. Defaults to None,
+            for hoverlabels which only use the x and y values.
         marker_colour: Either a rgb/rgba/hex string specifying a single
             colour for all bars or a series containing colour values for
             each y value. Defaults to rgba(50, 160, 200, 0.8).
@@ -40,10 +41,6 @@ def plot(
         hovertemplate=hovertemplate,
     )
 
-    layout = dict(
-        **ChartLayout.GENERAL,
-        **ChartLayout.HORIZONTAL_BAR,
-        height=height,
-    )
+    layout = {**ChartLayout.HORIZONTAL_BAR_MERGED, "height": height}
 
     return go.Figure(data=data, layout=layout)
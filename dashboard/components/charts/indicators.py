@@ -1,46 +1,61 @@
 """Module with a function to plot a gauge chart."""
 
+import json
+
 from dash import dcc
 import plotly.graph_objects as go
+import plotly.io as pio
 
+from dashboard.cache import cache
 
-def plot_gauge(
+
+# Static parts of the gauge and layout shared by every bullet chart.
+_GAUGE_BASE = {
+    "bar": {"color": "steelblue", "thickness": 0.8},
+    "bordercolor": "rgb(220,220,220)",
+    "borderwidth": 3,
+    "shape": "bullet",
+}
+
+_THRESHOLD_LINE = {"color": "red", "width": 4}
+
+_LAYOUT = {
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "font": {"color": "rgb(220,220,220)"},
+    "margin": {"l": 30, "r": 30, "t": 30, "b": 30},
+    "height": 100,
+}
+
+
+@cache.memoize()
+def _gauge_json(
     score: int | float,
     axis_limit: int,
-    value_format: str = ".0f",
-    threshold: int = None,
-) -> dcc.Graph:
-    """Plot a bullet chart.
+    value_format: str,
+    threshold: int | None,
+) -> str:
+    """Return the bullet chart serialized as JSON.
 
     Args:
         score: Value to display on the bullet chart.
         axis_limit: Upper bound displayed on the bullet chart.
-        value_format: String format for the display value. If the format
-            contains '%', the axis values will also be formatted as
-            percentages. Defaults to '0.f'.
+        value_format: String format for the display value.
         threshold: Value of threshold line to display on the bullet
-            chart. Defaults to None.
+            chart, or None.
 
     Returns:
-        Dash Core Components Graph object with the plotted chart.
+        JSON string of the plotted chart.
     """
-
-    gauge = {
-        "axis": {
-            "range": [0, axis_limit],
-        },
-        "bar": {"color": "steelblue", "thickness": 0.8},
-        "bordercolor": "rgb(220,220,220)",
-        "borderwidth": 3,
-        "shape": "bullet",
-    }
-
+    axis = {"range": [0, axis_limit]}
     if "%" in value_format:
-        gauge["axis"]["tickformat"] = ".0%"
+        axis["tickformat"] = ".0%"
+
+    gauge = {**_GAUGE_BASE, "axis": axis}
 
     if threshold:
         gauge["threshold"] = {
-            "line": {"color": "red", "width": 4},
+            "line": _THRESHOLD_LINE,
             "thickness": 0.75,
             "value": threshold,
         }
@@ -53,14 +68,30 @@ def plot_gauge(
         number={"valueformat": value_format},
     )
 
-    layout = {
-        "paper_bgcolor": "rgba(0,0,0,0)",
-        "plot_bgcolor": "rgba(0,0,0,0)",
-        "font": {"color": "rgb(220,220,220)"},
-        "margin": {"l": 30, "r": 30, "t": 30, "b": 30},
-        "height": 100,
-    }
+    fig = go.Figure(data=data, layout=_LAYOUT)
+
+    return pio.to_json(fig)
 
-    fig = go.Figure(data=data, layout=layout)
 
-    return dcc.Graph(figure=fig)
+def plot_gauge(
+    score: int | float,
+    axis_limit: int,
+    value_format: str = ".0f",
+    threshold: int = None,
+) -> dcc.Graph:
+    """Plot a bullet chart.
+
+    Args:
+        score: Value to display on the bullet chart.
+        axis_limit: Upper bound displayed on the bullet chart.
+        value_format: String format for the display value. If the format
+            contains '%', the axis values will also be formatted as
+            percentages. Defaults to '0.f'.
+        threshold: Value of threshold line to display on the bullet
+            chart. Defaults to None.
+
+    Returns:
+        Dash Core Components Graph object with the plotted chart.
+    """
+    figure = _gauge_json(score, axis_limit, value_format, threshold)
+    return dcc.Graph(figure=json.loads(figure))
@@ -6,62 +6,86 @@ Classes:
     SummaryColours: Answer and database summary chart colours.
 """
 
+from types import MappingProxyType
+
 
 class ChartLayout:
     """Class with layout specifications for different chart types.
 
+    The layouts are wrapped in MappingProxyType so that a chart cannot
+    add or replace a top-level key of a layout shared with other
+    charts. The proxy is shallow: nested dicts such as 'xaxis' remain
+    mutable, as Plotly does not accept read-only mappings for nested
+    properties, so they must not be modified in place. Unpack a layout
+    into a new dict, with new nested dicts for any overridden nested
+    property, to override any of the specifications.
+
     Attributes:
         GENERAL: Layout specifications used on all charts.
         HORIZONTAL_BAR: Layout specifications for horizontal bar charts.
         LINE: Layout specifications for line charts.
+        HORIZONTAL_BAR_MERGED: GENERAL merged with HORIZONTAL_BAR.
+        LINE_MERGED: GENERAL merged with LINE.
     """
 
-    GENERAL = {
-        "font": {
-            "color": "rgb(240, 240, 240)",
-        },
-        "plot_bgcolor": "rgba(0, 0, 0, 0)",
-        "paper_bgcolor": "rgba(0, 0, 0, 0)",
-    }
+    GENERAL = MappingProxyType(
+        {
+            "font": {
+                "color": "rgb(240, 240, 240)",
+            },
+            "plot_bgcolor": "rgba(0, 0, 0, 0)",
+            "paper_bgcolor": "rgba(0, 0, 0, 0)",
+        }
+    )
     """Layout specifications used on all charts.
     
     This specifies the font as well as making the plot and paper
     backgrounds transparent.
     """
 
-    HORIZONTAL_BAR = {
-        "xaxis": {
-            "gridcolor": "rgb(100, 100, 100)",
-            "gridwidth": 1,
-            "linecolor": "rgb(200, 200, 200)",
-            "linewidth": 3,
-        },
-        "yaxis": {
-            "linecolor": "rgb(200, 200, 200)",
-            "linewidth": 3,
-        },
-        "margin": {
-            "t": 20,
-            "b": 30,
-            "r": 30,
-        },
-    }
+    HORIZONTAL_BAR = MappingProxyType(
+        {
+            "xaxis": {
+                "gridcolor": "rgb(100, 100, 100)",
+                "gridwidth": 1,
+                "linecolor": "rgb(200, 200, 200)",
+                "linewidth": 3,
+            },
+            "yaxis": {
+                "linecolor": "rgb(200, 200, 200)",
+                "linewidth": 3,
+            },
+            "margin": {
+                "t": 20,
+                "b": 30,
+                "r": 30,
+            },
+        }
+    )
     """Layout specifications for horizontal bar charts."""
 
-    LINE = {
-        "xaxis": {
-            "gridcolor": "rgba(0, 0, 0, 0)",
-        },
-        "yaxis": {
-            "gridcolor": "rgb(50, 50, 50)",
-            "gridwidth": 1,
-            "linecolor": "rgb(200, 200, 200)",
-            "linewidth": 3,
-            "rangemode": "tozero",
-        },
-    }
+    LINE = MappingProxyType(
+        {
+            "xaxis": {
+                "gridcolor": "rgba(0, 0, 0, 0)",
+            },
+            "yaxis": {
+                "gridcolor": "rgb(50, 50, 50)",
+                "gridwidth": 1,
+                "linecolor": "rgb(200, 200, 200)",
+                "linewidth": 3,
+                "rangemode": "tozero",
+            },
+        }
+    )
     """Layout specifications for line charts."""
 
+    HORIZONTAL_BAR_MERGED = MappingProxyType({**GENERAL, **HORIZONTAL_BAR})
+    """General and horizontal bar layout specifications merged once."""
+
+    LINE_MERGED = MappingProxyType({**GENERAL, **LINE})
+    """General and line layout specifications merged once."""
+
 
 class PerformanceColours:
     """Class with colours for performance charts.
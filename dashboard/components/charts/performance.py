@@ -1,103 +1,153 @@
 """Module with functions to plot charts on the performance summary page."""
 
+import json
+
 from dash import dcc, html
 import plotly.graph_objects as go
+import plotly.io as pio
 import polars as pl
-import numpy as np
 
-from dashboard.app import db_data
+from dashboard.cache import cache
 from dashboard.components import PerformanceIds
 from dashboard.components.charts import horizontal_bar
 from dashboard.components.charts.layout import ChartLayout, PerformanceColours
-from dashboard.utilities import format_enums
+from dashboard.data import get_db_data
+from dashboard.utilities import format_enums, format_enums_expr
+
+
+# Layout for the cumulative average line chart, merged once at import.
+_CUMULATIVE_AVERAGE_LAYOUT = {**ChartLayout.LINE_MERGED, "margin": {"t": 30}}
 
+# Colour literals for add_colours. Expressions are immutable so they are
+# built once and reused by every query.
+_GREEN = pl.lit(PerformanceColours.GREEN)
+_YELLOW = pl.lit(PerformanceColours.YELLOW)
+_RED = pl.lit(PerformanceColours.RED)
 
-def add_colours(df: pl.DataFrame) -> pl.DataFrame:
-    """Add BarColour column to DataFrame.
+
+def add_colours(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Add BarColour column to LazyFrame.
 
     Attributes with a mean score >= 0.8 are assigned green, >= 0.7
     yellow, and <0.7 red.
 
     Args:
-        df: DataFrame to add colour column to.
+        df: LazyFrame to add colour column to.
 
     Returns:
-        DataFrame with added BarColour column.
+        LazyFrame with added BarColour column.
     """
-    return df.with_column(
+    return df.with_columns(
         pl.when(pl.col("Mean") >= 0.8)
-        .then(PerformanceColours.GREEN)
+        .then(_GREEN)
         .when(pl.col("Mean") >= 0.7)
-        .then(PerformanceColours.YELLOW)
-        .otherwise(PerformanceColours.RED)
+        .then(_YELLOW)
+        .otherwise(_RED)
         .alias("BarColour")
     )
 
 
-def plot_marks_summary(category: str, height: int = 450) -> html.Div:
-    """Plot horizontal bar chart with mean marks per category attribute.
+@cache.memoize()
+def _marks_summary_json(category: str, height: int, version: str) -> str:
+    """Return the marks summary chart serialized as JSON.
 
     Args:
         category: Category to aggregate marks by. This can be
             GrammarCategory, PartofSpeech or WordCategory.
-        height: Height of the plot in pixels. Defaults to 450.
+        height: Height of the plot in pixels.
+        version: Version of the fetched data. It is part of the cache
+            key, so the chart is rebuilt when the data changes.
 
     Returns:
-        html.Div containing a Dash Core Components Graph object with
-        the plotted chart.
+        JSON string of the plotted chart.
     """
-    df = db_data.calculate_mean_marks_by_category(category)
-    df = add_colours(df)
+    df = (
+        add_colours(get_db_data().calculate_mean_marks_by_category(category))
+        .with_columns(format_enums_expr("Category").alias("Label"))
+        .collect()
+    )
+
+    categories = df.get_column("Label").to_list()
+    means = df.get_column("Mean").to_numpy()
 
-    categories = [format_enums(cat) for cat in df.get_column("Category").to_list()]
-    means = df.get_column("Mean")
-    customdata = np.stack((categories, means), axis=-1)
-    hovertemplate = "%{customdata[0]}<br>%{customdata[1]:.3f}<extra></extra>"
+    # The hoverlabel shows the category and mean, which are already the
+    # bars' y and x values, so no customdata is needed.
+    hovertemplate = "%{y}<br>%{x:.3f}<extra></extra>"
 
     fig = horizontal_bar.plot(
         x=means,
         y=categories,
-        customdata=customdata,
         hovertemplate=hovertemplate,
         marker_colour=df.get_column("BarColour"),
         height=height,
     )
 
-    return html.Div(dcc.Graph(figure=fig), id=f"marks-summary-{category}")
+    return pio.to_json(fig)
 
 
-def plot_cumulative_average() -> html.Div:
-    """Plot line chart showing cumulative average mean score.
+def plot_marks_summary(category: str, height: int = 450) -> html.Div:
+    """Plot horizontal bar chart with mean marks per category attribute.
 
-    The line chart shows the cumulative average mean score over time for
-    each word category, including an All category which includes all
-    words.
+    Args:
+        category: Category to aggregate marks by. This can be
+            GrammarCategory, PartofSpeech or WordCategory.
+        height: Height of the plot in pixels. Defaults to 450.
 
     Returns:
         html.Div containing a Dash Core Components Graph object with
         the plotted chart.
     """
-    df = db_data.calculate_cumulative_average_score()
-    word_categories = df.get_column("WordCategory").unique().sort()
+    return html.Div(
+        dcc.Graph(
+            figure=json.loads(
+                _marks_summary_json(category, height, get_db_data().version)
+            )
+        ),
+        id=f"marks-summary-{category}",
+    )
+
+
+@cache.memoize()
+def _cumulative_average_json(version: str) -> str:
+    """Return the cumulative average chart serialized as JSON.
+
+    Args:
+        version: Version of the fetched data. It is part of the cache
+            key, so the chart is rebuilt when the data changes.
+
+    Returns:
+        JSON string of the plotted chart.
+    """
+    df = get_db_data().calculate_cumulative_average_score().collect()
+    partitions = df.partition_by("WordCategory", as_dict=True)
 
     data = [
-        go.Scatter(
-            x=df.filter(pl.col("WordCategory") == word_category).get_column("Date"),
-            y=df.filter(pl.col("WordCategory") == word_category).get_column(
-                "Cumulative Average"
-            ),
+        go.Scattergl(
+            x=partition.get_column("Date").to_numpy(),
+            y=partition.get_column("Cumulative Average").to_numpy(),
             mode="lines",
             name=format_enums(word_category),
         )
-        for word_category in word_categories
+        for word_category, partition in sorted(partitions.items())
     ]
 
-    layout = dict(
-        **ChartLayout.GENERAL,
-        **ChartLayout.LINE,
-        margin={"t": 30},
-    )
+    fig = go.Figure(data=data, layout=_CUMULATIVE_AVERAGE_LAYOUT)
+
+    return pio.to_json(fig)
+
 
-    fig = go.Figure(data=data, layout=layout)
+def plot_cumulative_average() -> html.Div:
+    """Plot line chart showing cumulative average mean score.
+
+    The line chart shows the cumulative average mean score over time for
+    each word category, including an All category which includes all
+    words.
 
-    return html.Div(dcc.Graph(figure=fig), id=PerformanceIds.CUMULATIVE_AVERAGE)
+    Returns:
+        html.Div containing a Dash Core Components Graph object with
+        the plotted chart.
+    """
+    return html.Div(
+        dcc.Graph(figure=json.loads(_cumulative_average_json(get_db_data().version))),
+        id=PerformanceIds.CUMULATIVE_AVERAGE,
+    )
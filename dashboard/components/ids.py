@@ -16,6 +16,8 @@ class AnswerIds:
         ANSWERS_OVER_TIME: Line chart showing answer count over time.
         TIME_PERIOD_INPUT: Time period selector for ANSWERS_OVER_TIME.
         ANSWERS_OVER_TIME_TITLE: Chart title for ANSWERS_OVER_TIME.
+        ANSWERS_OVER_TIME_FIGURES: Store with the ANSWERS_OVER_TIME
+            figure for each time period.
         ENGLISH_TO_SWEDISH: Bullet chart showing Eng/Swe answer ratio.
     """
 
@@ -24,6 +26,7 @@ class AnswerIds:
     ANSWERS_OVER_TIME = "answers-over-time"
     TIME_PERIOD_INPUT = "time-period-input"
     ANSWERS_OVER_TIME_TITLE = "answers-over-time-title"
+    ANSWERS_OVER_TIME_FIGURES = "answers-over-time-figures"
     ENGLISH_TO_SWEDISH = "english-to-swedish"
 
 
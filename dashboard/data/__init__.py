@@ -1,4 +1,4 @@
-from dashboard.data.data import Data
+from dashboard.data.data import Data, get_db_data
 
 
-__all__ = ["Data"]
+__all__ = ["Data", "get_db_data"]
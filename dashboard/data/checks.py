@@ -0,0 +1,93 @@
+"""Script to check dashboard calculations against reference versions.
+
+The reference versions are the original, simpler implementations of
+calculations which have since been optimised. Comparing the two for a
+database catches regressions in the optimised versions. The checks can
+be run against the database by running:
+
+    python3 -m dashboard.data.checks
+
+Functions:
+    reference_cumulative_average_score: Cumulative average score as
+        originally calculated.
+    check_cumulative_average_score: Compare the cumulative average
+        score with the reference.
+    main: Function to run the script.
+"""
+
+import polars as pl
+
+from dashboard.data.data import Data
+
+
+def reference_cumulative_average_score(answers: pl.DataFrame) -> pl.DataFrame:
+    """Calculate the cumulative average score as originally calculated.
+
+    The daily averages are calculated from a second copy of every
+    answer for the All category and the cumulative averages are
+    evaluated over each growing window of dates.
+
+    Args:
+        answers: DataFrame with Date, WordCategory and Mark columns.
+
+    Returns:
+        DataFrame with the same columns as
+        Data.calculate_cumulative_average_score.
+    """
+    all_answers = answers.with_columns(pl.lit("All").alias("WordCategory"))
+    return (
+        pl.concat([all_answers, answers])
+        .groupby(["Date", "WordCategory"])
+        .agg(pl.col("Mark").mean().alias("Average"))
+        .sort("Date")
+        .with_columns(
+            pl.col("Average")
+            .cumulative_eval(pl.element().mean())
+            .over("WordCategory")
+            .alias("Cumulative Average")
+        )
+    )
+
+
+def check_cumulative_average_score(data: Data, tolerance: float = 1e-9) -> float:
+    """Compare Data.calculate_cumulative_average_score with the reference.
+
+    Args:
+        data: Data instance to check.
+        tolerance: Largest allowed absolute difference between values.
+
+    Returns:
+        The largest absolute difference between the Average and
+        Cumulative Average values.
+
+    Raises:
+        ValueError: If the rows differ or any value differs by more
+            than the tolerance.
+    """
+    keys = ["Date", "WordCategory"]
+    columns = ["Average", "Cumulative Average"]
+    expected = reference_cumulative_average_score(data._answers).sort(keys)
+    actual = data.calculate_cumulative_average_score().collect().sort(keys)
+
+    if not expected.select(keys).frame_equal(actual.select(keys)):
+        raise ValueError("Cumulative average rows differ from the reference.")
+
+    difference = max(
+        (expected.get_column(column) - actual.get_column(column)).abs().max()
+        for column in columns
+    )
+    if difference > tolerance:
+        raise ValueError(
+            f"Cumulative average differs from the reference by {difference}."
+        )
+    return difference
+
+
+def main() -> None:
+    """Main function to run script."""
+    difference = check_cumulative_average_score(Data())
+    print(f"Cumulative average score matches the reference (max diff {difference}).")
+
+
+if __name__ == "__main__":
+    main()
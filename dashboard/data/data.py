@@ -5,20 +5,38 @@ Classes:
     
 Functions:
     add_missing_dates: Add missing dates to DataFrame.
-    add_period_columns:
+    add_period_sort_columns: Add integer week and month sort keys.
+    format_period: Expression formatting period labels.
     join_answers_and_words:
-    aggregate_marks: Calculate number of marks per day.
     start_of_today: Return datatime object for today.
+    get_db_data: Return the shared Data instance.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property
 
 import polars as pl
 
 import database as db
+from dashboard.cache import cache
 from dashboard.utilities import format_percentage
 
 
+# Columns to group and sort each period by, and strftime formats for
+# the Week and Month period labels.
+_PERIOD_SORT_COLUMNS = {"Day": "Date", "Week": "Week Sort", "Month": "Month Sort"}
+_PERIOD_LABEL_FORMATS = {"Week": "w%V '%G", "Month": "%b '%y"}
+
+# Categories shown in the mean marks charts on the performance page.
+_MARK_CATEGORIES = (
+    "TranslationDirection",
+    "PartOfSpeech",
+    "GrammarCategory",
+    "WordCategory",
+)
+
+
 def start_of_today() -> datetime:
     """Return datetime object for today.
 
@@ -51,93 +69,72 @@ def add_missing_dates(df: pl.DataFrame) -> pl.DataFrame:
     dates = df.get_column("Date")
     low: datetime = dates.min()
     high: datetime = dates.max()
-    date_range = pl.DataFrame(
-        {"Date": pl.date_range(low, high, timedelta(days=1)).cast(pl.Date)}
-    )
 
-    # Use an anti-join to find all dates not present in the database
-    # responses and assign them a daily answers count of 0.
-    missing_dates = date_range.join(df, on="Date", how="anti").with_column(
-        pl.lit(0).cast(pl.UInt32).alias("Daily Answers")
-    )
-    return pl.concat([df, missing_dates])
+    # Each date appears once, so if there are as many rows as days in
+    # the range then no dates are missing.
+    if df.height == (high - low).days + 1:
+        return df.sort("Date")
+
+    date_range = pl.date_range(low, high, "1d", name="Date").cast(pl.Date).to_frame()
 
+    # Left join the answer counts onto the full date range, giving the
+    # dates with no answers a daily answers count of 0. The result is
+    # in date order.
+    return date_range.join(df, on="Date", how="left").with_columns(
+        pl.col("Daily Answers").fill_null(0)
+    )
 
-def add_period_columns(df: pl.DataFrame, period: str) -> pl.DataFrame:
-    """Add a period and period sort column to the DataFrame.
 
-    The period column gives the date for each entry in the specified
-    period format. E.g. if the date value is '2022-12-01' and the period
-    is Month, the Period value will be "Dec '22".
+def add_period_sort_columns(df: pl.DataFrame) -> pl.DataFrame:
+    """Add week and month sort columns to the DataFrame.
 
-    The Period Sort column assigned an integer value to each period
-    which allows them to be sorted in chronological order. This is
-    needed as week and month periods are strings and therefore do not
-    sort chronologically.
+    The sort columns assign an integer value to each week and month
+    which allows them to be grouped and sorted in chronological order.
+    E.g. if the date value is '2022-12-01' the Month Sort value will be
+    202212. Daily periods are grouped and sorted by the Date column.
 
     Note: ISO weeks and years are used.
 
     Args:
-        df: DataFrame to add Period and Period Sort columns to.
-        period: Period format to use. Day, Week or Month.
+        df: DataFrame to add the sort columns to.
 
     Returns:
-        DataFrame with Period and Period Sort columns added.
+        DataFrame with Week Sort and Month Sort columns added.
 
         Columns:
             Date: Datetime
             Daily Answers: Int
-            Period: Datetime | String
-            Period Sort: Int
+            Week Sort: Int
+            Month Sort: Int
     """
-    # fmt: off
-    if period == "Day":
-        return (
-            df.with_column(pl.col("Date").alias("Period"))
-            .with_column(pl.col("Date").alias("Period Sort"))
-        )
-
-    if period == "Week":
-        return (
-            df.with_column(pl.col("Date").dt.strftime("w%V '%G").alias("Period"))
-            .with_column(
-                (pl.col("Date").dt.iso_year() * 100 + pl.col("Date").dt.week())
-                .alias("Period Sort")
-            )
-        )
-
-    if period == "Month":
-        return (
-            df.with_column(pl.col("Date").dt.strftime("%b '%y").alias("Period"))
-            .with_column(
-                (pl.col("Date").dt.year() * 100 + pl.col("Date").dt.month())
-                .alias("Period Sort")
-            )
-        )
-    # fmt: on
-
-    raise ValueError(f"Unsupported time period: {period}.")
+    return df.with_columns(
+        [
+            (pl.col("Date").dt.iso_year() * 100 + pl.col("Date").dt.week()).alias(
+                "Week Sort"
+            ),
+            (pl.col("Date").dt.year() * 100 + pl.col("Date").dt.month()).alias(
+                "Month Sort"
+            ),
+        ]
+    )
 
 
-def aggregate_marks(marks: pl.DataFrame) -> pl.DataFrame:
-    """Aggregate the responses, counting the number of marks per day.
+def format_period(period: str) -> pl.Expr:
+    """Return an expression formatting the Period column as labels.
 
-    Convert the Unix timestamp into a date object and then count the
-    number of responses per day. Add all dates missing from the response
-    date range, assigning them response counts of 0.
+    The Period column holds a date within each period. For Week and
+    Month periods it is formatted as e.g. "w48 '22" or "Dec '22". Daily
+    periods are left as dates.
 
     Args:
-        marks: DataFrame with Answer database table.
+        period: Period format to use. Day, Week or Month.
 
     Returns:
-        A DataFrame with an answer count by day for all days in the
-        Answer table date range.
+        Expression evaluating to the Period labels.
     """
-    dates = marks.select(
-        (pl.col("Timestamp") * 1000000).cast(pl.Datetime).cast(pl.Date).alias("Date")
-    )
-    per_day = dates.groupby("Date").agg(pl.col("Date").count().alias("Daily Answers"))
-    return add_missing_dates(per_day)
+    if period == "Day":
+        return pl.col("Period")
+    return pl.col("Period").dt.strftime(_PERIOD_LABEL_FORMATS[period])
 
 
 class Data:
@@ -147,91 +144,170 @@ class Data:
         """_summary_"""
         self.fetch()
 
+    def __repr__(self) -> str:
+        """Return a repr identifying the version of the fetched data.
+
+        The repr forms part of the cache key for memoized methods. It
+        contains the data version rather than the instance's memory
+        address, so it is the same in every process for the same data
+        and changes when the data does.
+        """
+        return f"{self.__class__.__name__}(version={self.version!r})"
+
     def fetch(self) -> None:
-        """Fetch data from the database."""
-        self._marks = db.to_polars("SELECT * FROM Answer")
-        self._words = db.to_polars(db.views.words_info)
-        self._answers = db.to_polars(db.views.answers)
-        self._aggregated_marks = aggregate_marks(self._marks)
+        """Fetch data from the database.
+
+        The answer KPIs and daily answer counts are aggregated by
+        SQLite, so only the aggregated rows are read rather than the
+        whole Answer table.
+        """
+        # Clear any properties cached from previously fetched data.
+        for name, attribute in vars(type(self)).items():
+            if isinstance(attribute, cached_property):
+                self.__dict__.pop(name, None)
+
+        # The queries are independent and connectorx opens a connection
+        # per query, so they are run concurrently.
+        with ThreadPoolExecutor() as executor:
+            words = executor.submit(db.to_polars, db.views.word_categories)
+            answers = executor.submit(db.to_polars, db.views.answer_marks)
+            daily_answers = executor.submit(self._fetch_daily_answers)
+            kpis = executor.submit(self._fetch_kpis)
+
+        self._words = words.result()
+        self._answers = answers.result().with_columns(
+            (pl.col("Timestamp") * 1000000)
+            .cast(pl.Datetime)
+            .cast(pl.Date)
+            .alias("Date")
+        )
+        self._aggregated_marks = add_period_sort_columns(daily_answers.result())
+        self._kpis = kpis.result()
+
+        # The cache persists across restarts, so memoized results are
+        # keyed on a version of the data. New answers change the count
+        # and last timestamp. The sum of the word row hashes changes when
+        # words are added or removed, or their group or categories are
+        # edited. Translations are not fetched, as no chart uses them.
+        self.version = "-".join(
+            str(value)
+            for value in (
+                self._kpis["Count"],
+                self._kpis["Last Timestamp"],
+                self._words.height,
+                self._words.hash_rows().sum(),
+            )
+        )
+
+    def _fetch_daily_answers(self) -> pl.DataFrame:
+        """Fetch the number of answers per day.
+
+        Dates with no answers are added with an answer count of 0. The
+        counts are read from the DailyAnswerSummary table. Databases
+        created before that table was added fall back to aggregating
+        the Answer table, until database.add_daily_answer_summary is
+        run.
 
-    @property
+        Returns:
+            A DataFrame with an answer count by day for all days in the
+            Answer table date range.
+        """
+        if db.to_polars(db.views.daily_answer_summary_exists).row(0)[0]:
+            query = db.views.daily_answers
+        else:
+            query = db.views.daily_answers_from_answer
+        daily_answers = db.to_polars(query).with_columns(
+            [
+                pl.col("Date").str.strptime(pl.Date, "%Y-%m-%d"),
+                pl.col("Daily Answers").cast(pl.UInt32),
+            ]
+        )
+        return add_missing_dates(daily_answers)
+
+    def _fetch_kpis(self) -> dict:
+        """Fetch the answer count and mark KPIs in a single query.
+
+        Returns:
+            Dict with the KPI values, keyed by KPI name.
+        """
+        today = start_of_today()
+        week_start = today - timedelta(days=today.weekday())
+        query = db.views.answer_kpis.format(
+            week_start=datetime.timestamp(week_start),
+            today=datetime.timestamp(today),
+        )
+        return db.to_polars(query).to_dicts()[0]
+
+    @cached_property
     def answer_count(self) -> int:
         """Number of answers given."""
-        return self._marks.shape[0]
+        return self._kpis["Count"]
 
-    @property
+    @cached_property
     def answer_count_this_week(self) -> int:
         """Number of answers this calendar week."""
-        today = datetime.today()
-        week_start = (today - timedelta(days=today.weekday())).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-
-        return self._marks.filter(
-            pl.col("Timestamp") >= datetime.timestamp(week_start)
-        ).shape[0]
+        return self._kpis["Count This Week"]
 
-    @property
+    @cached_property
     def answer_count_today(self) -> int:
         """Number of answers during the current day."""
-        today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
-        return self._marks.filter(
-            pl.col("Timestamp") >= datetime.timestamp(today)
-        ).shape[0]
+        return self._kpis["Count Today"]
 
-    @property
+    @cached_property
     def swedish_answer_percentage(self) -> None:
         """Percentage of all answers answered in Swedish."""
-        return (
-            self._marks.filter(pl.col("TranslationDirectionID") == 1).shape[0]
-            / self._marks.shape[0]
-        )
+        return self._kpis["Swedish Count"] / self._kpis["Count"]
+
+    @cached_property
+    def percent_correct_value(self) -> float:
+        """Proportion of correct answers, as a decimal."""
+        return self._kpis["Mean Mark"]
 
-    @property
-    def percent_correct(self) -> float:
+    @cached_property
+    def percent_correct(self) -> str:
         """Percentage of correct answers."""
-        return format_percentage(self._marks.get_column("Mark").mean())
+        return format_percentage(self.percent_correct_value)
 
-    @property
-    def percent_daily_target_achieved(self) -> float:
+    @cached_property
+    def percent_daily_target_achieved_value(self) -> float:
+        """Proportion of days where the daily target was achieved."""
+        return self._aggregated_marks.select(
+            (pl.col("Daily Answers") >= 80).cast(pl.Float64).mean()
+        ).row(0)[0]
+
+    @cached_property
+    def percent_daily_target_achieved(self) -> str:
         """Percentage of days where the daily target was achieved."""
-        return format_percentage(
-            self._aggregated_marks.with_column(
-                pl.when(pl.col("Daily Answers") >= 80)
-                .then(1)
-                .otherwise(0)
-                .alias("Success")
-            )
-            .get_column("Success")
-            .mean()
-        )
+        return format_percentage(self.percent_daily_target_achieved_value)
 
-    @property
-    def percent_weekly_target_achieved(self) -> float:
-        """Percentage of weeks where the weekly target was achieved."""
-        return format_percentage(
-            self._aggregated_marks.groupby(pl.col("Date").dt.week())
+    @cached_property
+    def percent_weekly_target_achieved_value(self) -> float:
+        """Proportion of weeks where the weekly target was achieved."""
+        return (
+            self._aggregated_marks.lazy()
+            .groupby("Week Sort")
             .agg(pl.col("Daily Answers").sum().alias("Weekly Answers"))
-            .with_column(
-                pl.when(pl.col("Weekly Answers") >= 560)
-                .then(1)
-                .otherwise(0)
-                .alias("Success")
-            )
-            .get_column("Success")
-            .mean()
+            .select((pl.col("Weekly Answers") >= 560).cast(pl.Float64).mean())
+            .collect()
+            .row(0)[0]
         )
 
-    @property
+    @cached_property
+    def percent_weekly_target_achieved(self) -> str:
+        """Percentage of weeks where the weekly target was achieved."""
+        return format_percentage(self.percent_weekly_target_achieved_value)
+
+    @cached_property
     def unique_word_count(self) -> int:
         """Number of unique word or phrase pairs."""
         return self._words.shape[0]
 
-    @property
+    @cached_property
     def unique_word_group_count(self) -> int:
         """Number of unique word groups."""
-        return self._words.get_column("WordGroup").unique().len()
+        return self._words.get_column("WordGroup").n_unique()
 
+    @cache.memoize()
     def count_answers_by_category(self, category: str) -> pl.DataFrame:
         """_summary_
 
@@ -241,41 +317,67 @@ class Data:
         Returns:
             _description_
         """
-        word_count = self._words.groupby(category).agg(pl.count().alias("Word Count"))
+        word_count = (
+            self._words.lazy().groupby(category).agg(pl.count().alias("Word Count"))
+        )
         answer_count = (
-            self._answers.select(pl.col(category))
+            self._answers.lazy()
+            .select(pl.col(category))
             .groupby(category)
             .agg(pl.count().alias("Answer Count"))
         )
         return (
             answer_count.join(word_count, on=category)
-            .with_column((pl.col("Answer Count") / pl.col("Word Count")).alias("Ratio"))
+            .with_columns(
+                (pl.col("Answer Count") / pl.col("Word Count")).alias("Ratio")
+            )
             .sort("Ratio")
+            .collect()
         )
 
-    def calculate_mean_marks_by_category(self, category: str) -> pl.DataFrame:
+    @cached_property
+    def mean_marks_by_category(self) -> dict[str, pl.DataFrame]:
+        """Mean mark per attribute for each of the mark categories.
+
+        The aggregations for all categories are collected together, so
+        the answers are only scanned in one batch of parallel queries
+        rather than once per chart.
+        """
+        queries = [
+            self._answers.lazy()
+            .groupby(category)
+            .agg(pl.col("Mark").mean().alias("Mean"))
+            .sort("Mean")
+            .rename({category: "Category"})
+            for category in _MARK_CATEGORIES
+        ]
+        return dict(zip(_MARK_CATEGORIES, pl.collect_all(queries)))
+
+    def calculate_mean_marks_by_category(self, category: str) -> pl.LazyFrame:
         """Calculate mean mark per attribute of the specified category.
 
+        A LazyFrame is returned so that callers can add further steps
+        which are executed when collected. The mean marks themselves
+        are looked up from mean_marks_by_category.
+
         Args:
-            category: Attribute to group by, either GrammarCategory,
-                PartofSpeech or WordCategory
+            category: Attribute to group by, either TranslationDirection,
+                GrammarCategory, PartofSpeech or WordCategory
 
         Returns:
-            DataFrame with mean mark per attribute of the specified
+            LazyFrame with mean mark per attribute of the specified
             category.
 
             Columns:
                 Category: Attributes of the specified category.
                 Mean: Mean mark for all answers per attribute.
         """
-        return (
-            self._answers.groupby(category)
-            .agg(pl.col("Mark").mean().alias("Mean"))
-            .sort("Mean")
-            .rename({category: "Category"})
-        )
+        return self.mean_marks_by_category[category].lazy()
 
-    def count_answers_by_time_period(self, period: str, rolling_period) -> pl.DataFrame:
+    @cache.memoize()
+    def count_answers_by_time_period(
+        self, period: str, rolling_period: int
+    ) -> pl.DataFrame:
         """Calculate answer count by time period with a rolling average.
 
         Args:
@@ -295,22 +397,38 @@ class Data:
                 Rolling Average: Float
 
         """
-        df = add_period_columns(self._aggregated_marks, period)
+        if period not in _PERIOD_SORT_COLUMNS:
+            raise ValueError(f"Unsupported time period: {period}.")
+        sort_column = _PERIOD_SORT_COLUMNS[period]
 
         return (
-            df.groupby(["Period", "Period Sort"])
-            .agg(pl.col("Daily Answers").sum().alias("Count"))
+            self._aggregated_marks.lazy()
+            .groupby(sort_column)
+            .agg(
+                [
+                    pl.col("Date").first().alias("Period"),
+                    pl.col("Daily Answers").sum().alias("Count"),
+                ]
+            )
+            .rename({sort_column: "Period Sort"})
             .sort("Period Sort")
-            .with_column(
-                pl.col("Count")
-                .rolling_mean(rolling_period, min_periods=3)
-                .alias("Rolling Average")
+            .with_columns(
+                [
+                    format_period(period),
+                    pl.col("Count")
+                    .rolling_mean(window_size=rolling_period, min_periods=3)
+                    .alias("Rolling Average"),
+                ]
             )
+            .collect()
         )
 
-    def calculate_cumulative_average_score(self) -> pl.DataFrame:
+    def calculate_cumulative_average_score(self) -> pl.LazyFrame:
         """_summary_
 
+        A LazyFrame is returned so that callers can add further steps
+        which are executed together with the aggregation when collected.
+
         Returns:
             _description_
 
@@ -320,26 +438,56 @@ class Data:
                 Average: Float
                 Cumulative Average: Float
         """
-        all_answers = self._answers.with_column(pl.lit("All").alias("WordCategory"))
-        df = pl.concat([all_answers, self._answers])
+        columns = ["Date", "WordCategory", "Mark Sum", "Answer Count"]
+        per_category = (
+            self._answers.lazy()
+            .groupby(["Date", "WordCategory"])
+            .agg(
+                [
+                    pl.col("Mark").sum().alias("Mark Sum"),
+                    pl.count().alias("Answer Count"),
+                ]
+            )
+            # Casting inside a multi-key groupby aggregation can misalign
+            # the values with their groups, so the casts are separate.
+            .with_columns(
+                [
+                    pl.col("Mark Sum").cast(pl.Int64),
+                    pl.col("Answer Count").cast(pl.Int64),
+                ]
+            )
+            .select(columns)
+        )
+
+        # The All category is aggregated from the per category sums and
+        # counts, rather than grouping a second copy of every answer.
+        all_categories = (
+            per_category.groupby("Date")
+            .agg([pl.col("Mark Sum").sum(), pl.col("Answer Count").sum()])
+            .with_columns(pl.lit("All").alias("WordCategory"))
+            .select(columns)
+        )
+
         return (
-            df.with_column(
-                (pl.col("Timestamp") * 1000000)
-                .cast(pl.Datetime)
-                .cast(pl.Date)
-                .alias("Date")
+            pl.concat([all_categories, per_category])
+            .with_columns(
+                (pl.col("Mark Sum") / pl.col("Answer Count")).alias("Average")
             )
-            .groupby(["Date", "WordCategory"])
-            .agg(pl.col("Mark").mean().alias("Average"))
+            .select(["Date", "WordCategory", "Average"])
             .sort("Date")
-            .with_column(
-                pl.col("Average")
-                .cumulative_eval(pl.element().mean())
-                .over("WordCategory")
-                .alias("Cumulative Average")
+            # The mean of all daily averages up to each date is the
+            # running sum divided by the running count. Unlike a mean
+            # evaluated over each growing window, this is linear in the
+            # number of dates.
+            .with_columns(
+                (
+                    pl.col("Average").cumsum().over("WordCategory")
+                    / (pl.col("Average").cumcount().over("WordCategory") + 1)
+                ).alias("Cumulative Average")
             )
         )
 
+    @cache.memoize()
     def count_words_by_category(self, group_by: str, count_by: str) -> pl.DataFrame:
         """Count unique WordIDs or WordGroups per category.
 
@@ -358,8 +506,29 @@ class Data:
                 Count: Int
         """
         return (
-            self._words.groupby(group_by)
-            .agg(pl.col(count_by).unique().count().alias("Count"))
-            .sort("Count", reverse=False)
+            self._words.lazy()
+            .groupby(group_by)
+            .agg(pl.col(count_by).n_unique().alias("Count"))
+            .sort("Count")
             .rename({group_by: "Category"})
+            .collect()
         )
+
+
+_db_data: Data | None = None
+
+
+def get_db_data() -> Data:
+    """Return the dashboard's Data instance, creating it on first use.
+
+    The data is fetched from the database when this is first called
+    rather than when the module is imported, so importing a module
+    which uses the data does not query the database.
+
+    Returns:
+        Data instance shared by the dashboard.
+    """
+    global _db_data
+    if _db_data is None:
+        _db_data = Data()
+    return _db_data
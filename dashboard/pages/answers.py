@@ -1,156 +1,166 @@
 """Module docstring."""
 
 import dash
-from dash import dcc, html, Input, Output, callback
-import dash_bootstrap_components as dbc
+from dash import dcc, html
 
-from dashboard.app import db_data
 from dashboard.components import AnswerIds
 from dashboard.components.charts import (
+    plot_answers_over_time_figures,
     plot_answers_summary,
     plot_gauge,
 )
+from dashboard.data import get_db_data
 
 
 dash.register_page(__name__, path="/", name="Answers Summary", title="Answers")
 
 
-@callback(
-    Output(AnswerIds.ANSWERS_OVER_TIME_TITLE, "children"),
-    Input(AnswerIds.TIME_PERIOD_INPUT, "value"),
-)
-def update_chart_title(period: str):
-    """Update chart title text based on time period input.
+def layout() -> html.Div:
+    """Create the answers summary page layout.
 
-    Args:
-        period: Either Day, Week, or Month. The value is taken from the
-            'time-period-input' selector.
+    The layout is created when the page is requested rather than when
+    the module is imported, so the charts and values are only built
+    for pages which are visited.
 
     Returns:
-        html.H6 component with updated title text.
+        html.Div containing the page layout.
     """
-    return html.H6(f"Answers Count per {period}", className="container-title")
-
+    db_data = get_db_data()
 
-layout = html.Div(
-    children=[
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        html.H6("Total Answers", className="container-title"),
-                        html.Div(db_data.answer_count, className="card"),
-                    ],
-                    className="rounded-border six-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6("Weekly Answers Target", className="container-title"),
-                        html.Div(
-                            plot_gauge(db_data.answer_count_this_week, 560),
-                            id=AnswerIds.ANSWER_COUNT_WEEKLY,
-                        ),
-                    ],
-                    className="rounded-border six-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6("Daily Answers Target", className="container-title"),
-                        html.Div(
-                            plot_gauge(db_data.answer_count_today, 80),
-                            AnswerIds.ANSWER_COUNT_TODAY,
-                        ),
-                    ],
-                    className="rounded-border six-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6("Daily Target Success", className="container-title"),
-                        html.Div(
-                            db_data.percent_daily_target_achieved,
-                            className="card",
-                        ),
-                    ],
-                    className="rounded-border six-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6("Weekly Target Success", className="container-title"),
-                        html.Div(
-                            db_data.percent_weekly_target_achieved,
-                            className="card",
-                        ),
-                    ],
-                    className="rounded-border six-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6("% English to Swedish", className="container-title"),
-                        html.Div(
-                            plot_gauge(
-                                score=db_data.swedish_answer_percentage,
-                                axis_limit=1,
-                                value_format=".1%",
-                                threshold=0.5,
+    return html.Div(
+        children=[
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.H6("Total Answers", className="container-title"),
+                            html.Div(db_data.answer_count, className="card"),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Weekly Answers Target", className="container-title"
+                            ),
+                            html.Div(
+                                plot_gauge(db_data.answer_count_this_week, 560),
+                                id=AnswerIds.ANSWER_COUNT_WEEKLY,
+                            ),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Daily Answers Target", className="container-title"
+                            ),
+                            html.Div(
+                                plot_gauge(db_data.answer_count_today, 80),
+                                AnswerIds.ANSWER_COUNT_TODAY,
+                            ),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Daily Target Success", className="container-title"
+                            ),
+                            html.Div(
+                                db_data.percent_daily_target_achieved,
+                                className="card",
+                            ),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Weekly Target Success", className="container-title"
+                            ),
+                            html.Div(
+                                db_data.percent_weekly_target_achieved,
+                                className="card",
+                            ),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "% English to Swedish", className="container-title"
+                            ),
+                            html.Div(
+                                plot_gauge(
+                                    score=db_data.swedish_answer_percentage,
+                                    axis_limit=1,
+                                    value_format=".1%",
+                                    threshold=0.5,
+                                ),
+                                AnswerIds.ENGLISH_TO_SWEDISH,
                             ),
-                            AnswerIds.ENGLISH_TO_SWEDISH,
-                        ),
-                    ],
-                    className="rounded-border six-per-row",
-                ),
-            ],
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Ratio of Total Answers to Words in Database per Part of Speech",
-                            className="container-title",
-                        ),
-                        plot_answers_summary("PartOfSpeech"),
-                    ],
-                    className="rounded-border three-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Ratio of Total Answers to Words in Database per Grammar Category",
-                            className="container-title",
-                        ),
-                        plot_answers_summary("GrammarCategory"),
-                    ],
-                    className="rounded-border three-per-row",
-                ),
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Ratio of Total Answers to Words in Database per Word Category",
-                            className="container-title",
-                        ),
-                        plot_answers_summary("WordCategory"),
-                    ],
-                    className="rounded-border three-per-row",
-                ),
-            ]
-        ),
-        dbc.Row(
-            dbc.Col(
+                        ],
+                        className="rounded-border",
+                    ),
+                ],
+                className="grid grid-6",
+            ),
+            html.Div(
                 [
-                    dbc.Row(
-                        dcc.RadioItems(
-                            id=AnswerIds.TIME_PERIOD_INPUT,
-                            options=["Day", "Week", "Month"],
-                            value="Week",
-                            inputStyle={"margin-right": "2px"},
-                            labelStyle={"margin-right": "10px"},
-                        ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Ratio of Total Answers to Words in Database per Part of Speech",
+                                className="container-title",
+                            ),
+                            plot_answers_summary("PartOfSpeech"),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Ratio of Total Answers to Words in Database per Grammar Category",
+                                className="container-title",
+                            ),
+                            plot_answers_summary("GrammarCategory"),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Ratio of Total Answers to Words in Database per Word Category",
+                                className="container-title",
+                            ),
+                            plot_answers_summary("WordCategory"),
+                        ],
+                        className="rounded-border",
                     ),
-                    dbc.Row(id=AnswerIds.ANSWERS_OVER_TIME_TITLE),
-                    dbc.Row(html.Div(id=AnswerIds.ANSWERS_OVER_TIME)),
                 ],
-                className="rounded-border one-per-row",
-            )
-        ),
-    ]
-)
+                className="grid grid-3",
+            ),
+            html.Div(
+                [
+                    dcc.RadioItems(
+                        id=AnswerIds.TIME_PERIOD_INPUT,
+                        options=["Day", "Week", "Month"],
+                        value="Week",
+                        inputStyle={"margin-right": "2px"},
+                        labelStyle={"margin-right": "10px"},
+                    ),
+                    html.H6(
+                        id=AnswerIds.ANSWERS_OVER_TIME_TITLE,
+                        className="container-title",
+                    ),
+                    dcc.Graph(id=AnswerIds.ANSWERS_OVER_TIME),
+                    dcc.Store(
+                        id=AnswerIds.ANSWERS_OVER_TIME_FIGURES,
+                        data=plot_answers_over_time_figures(),
+                    ),
+                ],
+                className="rounded-border",
+            ),
+        ]
+    )
@@ -1,75 +1,88 @@
 import dash
 from dash import html
-import dash_bootstrap_components as dbc
 
-from dashboard.app import db_data
 from dashboard.components.charts import (
     plot_marks_summary,
     plot_cumulative_average,
 )
+from dashboard.data import get_db_data
 
 
 dash.register_page(__name__, name="Performance Summary")
 
-layout = html.Div(
-    children=[
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        html.H6("Overall % Correct", className="container-title"),
-                        html.Div(db_data.percent_correct, className="card"),
-                    ],
-                    className="rounded-border",
-                ),
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Mean Score per Translation Direction",
-                            className="container-title",
-                        ),
-                        plot_marks_summary("TranslationDirection", height=120),
-                    ],
-                    className="rounded-border",
-                ),
-            ],
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Mean Score per Part of Speech",
-                            className="container-title",
-                        ),
-                        plot_marks_summary("PartOfSpeech"),
-                    ],
-                    className="rounded-border",
-                ),
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Mean Score per Grammar Category",
-                            className="container-title",
-                        ),
-                        plot_marks_summary("GrammarCategory"),
-                    ],
-                    className="rounded-border",
-                ),
-                dbc.Col(
-                    [
-                        html.H6(
-                            "Mean Score per Word Category",
-                            className="container-title",
-                        ),
-                        plot_marks_summary("WordCategory"),
-                    ],
-                    className="rounded-border",
-                ),
-            ]
-        ),
-        dbc.Row(
-            dbc.Col(
+
+def layout() -> html.Div:
+    """Create the performance summary page layout.
+
+    The layout is created when the page is requested rather than when
+    the module is imported, so the charts and values are only built
+    for pages which are visited.
+
+    Returns:
+        html.Div containing the page layout.
+    """
+    db_data = get_db_data()
+
+    return html.Div(
+        children=[
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.H6("Overall % Correct", className="container-title"),
+                            html.Div(db_data.percent_correct, className="card"),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Mean Score per Translation Direction",
+                                className="container-title",
+                            ),
+                            plot_marks_summary("TranslationDirection", height=120),
+                        ],
+                        className="rounded-border",
+                    ),
+                ],
+                className="grid grid-2",
+            ),
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.H6(
+                                "Mean Score per Part of Speech",
+                                className="container-title",
+                            ),
+                            plot_marks_summary("PartOfSpeech"),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Mean Score per Grammar Category",
+                                className="container-title",
+                            ),
+                            plot_marks_summary("GrammarCategory"),
+                        ],
+                        className="rounded-border",
+                    ),
+                    html.Div(
+                        [
+                            html.H6(
+                                "Mean Score per Word Category",
+                                className="container-title",
+                            ),
+                            plot_marks_summary("WordCategory"),
+                        ],
+                        className="rounded-border",
+                    ),
+                ],
+                className="grid grid-3",
+            ),
+            html.Div(
                 [
                     html.H6(
                         "Cumulative Mean Score",
@@ -79,6 +92,5 @@ layout = html.Div(
                 ],
                 className="rounded-border",
             ),
-        ),
-    ],
-)
+        ],
+    )
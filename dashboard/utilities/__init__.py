@@ -1,4 +1,14 @@
-from .formatting import format_enums, format_percentage, split_title
+from .formatting import (
+    format_enums,
+    format_enums_expr,
+    format_enum_series,
+    format_percentage,
+)
 
 
-__all__ = ["format_enums", "format_percentage", "split_title"]
+__all__ = [
+    "format_enums",
+    "format_enums_expr",
+    "format_enum_series",
+    "format_percentage",
+]
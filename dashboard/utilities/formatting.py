@@ -1,34 +1,27 @@
 """Module with functions to format text.
 
 Functions:
-    split_title: Split text to show whitespace between words.
     format_enums:
+    format_enums_expr: Expression formatting a column of enum values.
+    format_enum_series: Format a Series of enum values.
     format_percentage:
 """
 
-import re
+from functools import lru_cache
 
-
-def split_title(title: str) -> str:
-    """Introduce whitespaces to strings with concatenated words.
-
-    E.g. the string 'GraphTitle' would be converted to 'Graph Title'.
-
-    Args:
-        title: String to format.
-
-    Returns:
-        String split into individual words.
-    """
-    return " ".join(re.findall("[A-Z][a-z]*", title)).replace("I D", "ID")
+import polars as pl
 
 
+@lru_cache(maxsize=64)
 def format_enums(enum: str) -> str:
     """Format enum value to be displayed in graph.
 
     '_'s are replaced by spaces and then the string formatted using
     Pascal case. The enum 'NA' is not formatted.
 
+    There are only a small number of distinct enum values so the
+    results are cached, making repeat calls a dictionary lookup.
+
     Args:
         enum: Enum's string value.
 
@@ -40,6 +33,48 @@ def format_enums(enum: str) -> str:
     return enum.replace("_", " ").capitalize()
 
 
+def format_enums_expr(column: str) -> pl.Expr:
+    """Return an expression formatting a column of enum values.
+
+    This applies the same formatting as format_enums, but as a Polars
+    expression so that it can run as part of a query rather than
+    calling format_enums from Python for every row.
+
+    Args:
+        column: Name of the column with enum string values.
+
+    Returns:
+        Expression evaluating to the formatted enum string values.
+    """
+    enums = pl.col(column).cast(pl.Utf8)
+    words = enums.str.replace_all("_", " ")
+    capitalized = pl.concat_str(
+        [
+            words.str.slice(0, 1).str.to_uppercase(),
+            words.str.slice(1).str.to_lowercase(),
+        ]
+    )
+    return pl.when(enums == "NA").then(enums).otherwise(capitalized).alias(column)
+
+
+def format_enum_series(enums: pl.Series) -> list[str]:
+    """Format a Series of enum values to be displayed in a graph.
+
+    Args:
+        enums: Series of enum string values.
+
+    Returns:
+        List of formatted enum string values, in the order of the
+        Series.
+    """
+    return (
+        pl.DataFrame({"Enum": enums})
+        .select(format_enums_expr("Enum"))
+        .get_column("Enum")
+        .to_list()
+    )
+
+
 def format_percentage(value: float) -> str:
     """Convert a decimal value to a percentage string.
 
@@ -52,4 +87,4 @@ def format_percentage(value: float) -> str:
     Returns:
         The value as a percentage string.
     """
-    return f"{value * 100:.1f}%"
+    return f"{value:.1%}"
@@ -0,0 +1,27 @@
+"""Script to add the DailyAnswerSummary table to an existing database.
+
+Databases created before the table was added to create_db.py do not
+have it. The table is created, populated from the Answer table and the
+trigger which keeps it up to date is added by running:
+
+    python3 -m database.add_daily_answer_summary
+
+Running the script again rebuilds the table from the Answer table.
+
+Functions:
+    main: Function to run the script.
+"""
+
+import database as db
+from database.create_db import daily_answer_summary_statement
+
+
+def main() -> None:
+    """Main function to run script."""
+    connection, cursor = db.connect_with_cursor()
+    cursor.executescript(daily_answer_summary_statement)
+    db.commit_and_close(connection)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Script to add the Answer table indexes to an existing database.
+
+Databases created before the indexes were added to create_db.py do not
+have them. Replacing the Answer table, e.g. with remove_old.py, also
+drops them. The indexes can be added by running:
+
+    python3 -m database.add_indexes
+
+Functions:
+    main: Function to run the script.
+"""
+
+import database as db
+from database.create_db import index_statement
+
+
+def main() -> None:
+    """Main function to run script."""
+    connection, cursor = db.connect_with_cursor()
+    cursor.executescript(index_statement)
+    db.commit_and_close(connection)
+
+
+if __name__ == "__main__":
+    main()
@@ -81,6 +81,46 @@ CREATE TABLE Word (
 );
 """
 
+# Indexes for the Answer table columns which the dashboard filters and
+# joins on. IF NOT EXISTS allows them to be added to existing databases.
+index_statement = """
+CREATE INDEX IF NOT EXISTS idx_answer_timestamp ON Answer (Timestamp);
+CREATE INDEX IF NOT EXISTS idx_answer_word ON Answer (WordID);
+"""
+
+# Table with the number of answers and correct answers per UTC day. It
+# is rebuilt from the Answer table when this is run, and then kept up to
+# date by a trigger when answers are inserted.
+daily_answer_summary_statement = """
+CREATE TABLE IF NOT EXISTS DailyAnswerSummary (
+    Day          INTEGER PRIMARY KEY NOT NULL,
+    AnswerCount  INTEGER NOT NULL,
+    CorrectCount INTEGER NOT NULL
+);
+
+DELETE FROM DailyAnswerSummary;
+
+INSERT INTO DailyAnswerSummary (Day, AnswerCount, CorrectCount)
+    SELECT
+        CAST(Timestamp / 86400 AS INTEGER),
+        COUNT(*),
+        SUM(Mark)
+    FROM
+        Answer
+    GROUP BY
+        CAST(Timestamp / 86400 AS INTEGER);
+
+CREATE TRIGGER IF NOT EXISTS daily_answer_summary_insert
+AFTER INSERT ON Answer
+BEGIN
+    INSERT INTO DailyAnswerSummary (Day, AnswerCount, CorrectCount)
+    VALUES (CAST(NEW.Timestamp / 86400 AS INTEGER), 1, NEW.Mark)
+    ON CONFLICT (Day) DO UPDATE SET
+        AnswerCount = AnswerCount + 1,
+        CorrectCount = CorrectCount + excluded.CorrectCount;
+END;
+"""
+
 
 def parse_args() -> argparse.Namespace:
     """_summary_
@@ -122,6 +162,8 @@ def create_db(db_name: str, language1: str, language2: str) -> None:
     connection = sqlite3.connect(db_name)
     cursor = connection.cursor()
     cursor.executescript(statement.format(language1=language1, language2=language2))
+    cursor.executescript(index_statement)
+    cursor.executescript(daily_answer_summary_statement)
     connection.close()
 
 
@@ -15,6 +15,7 @@ Functions:
 import pandas as pd
 
 import database as db
+from database.create_db import daily_answer_summary_statement, index_statement
 
 
 def remove_old_marks() -> pd.DataFrame:
@@ -62,6 +63,11 @@ def commit(new_marks: pd.DataFrame) -> None:
     """
     connection = db.connect()
     new_marks.to_sql("Answer", connection, if_exists="replace", index=False)
+    # Replacing the table drops its indexes and trigger, so they are
+    # created again and the daily summary is rebuilt without the
+    # removed marks.
+    connection.executescript(index_statement)
+    connection.executescript(daily_answer_summary_statement)
     db.commit_and_close(connection)
 
 
@@ -36,6 +36,29 @@ answers = """
 """
 
 
+answer_marks = """
+    SELECT
+        P.PartOfSpeech,
+        C.WordCategory,
+        G.GrammarCategory,
+        D.TranslationDirection,
+        A.Mark,
+        A.Timestamp
+    FROM
+        Answer A
+    JOIN Word W
+        ON W.WordID = A.WordID
+    JOIN PartOfSpeech P
+        ON W.PartOfSpeechID = P.PartOfSpeechID
+    JOIN WordCategory C
+        ON W.WordCategoryID = C.WordCategoryID
+    JOIN GrammarCategory G
+        ON W.GrammarCategoryID = G.GrammarCategoryID
+    LEFT JOIN TranslationDirection D
+        ON A.TranslationDirectionID == D.TranslationDirectionID
+"""
+
+
 checkboxes = """
     SELECT
         W.WordID,
@@ -107,3 +130,67 @@ words_info = """
     LEFT JOIN Link L
         ON W.WordGroup = L.WiktionaryLink
 """
+
+
+answer_kpis = """
+    SELECT
+        COUNT(*) AS "Count",
+        SUM(A.Timestamp >= {week_start}) AS "Count This Week",
+        SUM(A.Timestamp >= {today}) AS "Count Today",
+        SUM(A.TranslationDirectionID = 1) AS "Swedish Count",
+        AVG(A.Mark) AS "Mean Mark",
+        MAX(A.Timestamp) AS "Last Timestamp"
+    FROM
+        Answer A
+"""
+
+
+daily_answers = """
+    SELECT
+        DATE(S.Day * 86400, 'unixepoch') AS Date,
+        S.AnswerCount AS "Daily Answers"
+    FROM
+        DailyAnswerSummary S
+"""
+
+
+# Fallback for databases created before DailyAnswerSummary was added,
+# which aggregates the Answer table directly.
+daily_answers_from_answer = """
+    SELECT
+        DATE(A.Timestamp, 'unixepoch') AS Date,
+        COUNT(*) AS "Daily Answers"
+    FROM
+        Answer A
+    GROUP BY
+        DATE(A.Timestamp, 'unixepoch')
+"""
+
+
+daily_answer_summary_exists = """
+    SELECT
+        COUNT(*) AS "Exists"
+    FROM
+        sqlite_master
+    WHERE
+        type = 'table'
+        AND name = 'DailyAnswerSummary'
+"""
+
+
+word_categories = """
+    SELECT
+        W.WordID,
+        W.WordGroup,
+        P.PartOfSpeech,
+        C.WordCategory,
+        G.GrammarCategory
+    FROM
+        Word W
+    JOIN PartOfSpeech P
+        ON W.PartOfSpeechID = P.PartOfSpeechID
+    JOIN WordCategory C
+        ON W.WordCategoryID = C.WordCategoryID
+    JOIN GrammarCategory G
+        ON W.GrammarCategoryID = G.GrammarCategoryID
+"""